@@ -0,0 +1,253 @@
+"""
+Legal Text Generators
+
+Builds the Privacy Policy and Terms of Service documents served by
+/api/generate. This module is pure string work with no FastAPI dependency, so
+it can be compiled ahead of time with mypyc (see setup.py); when a compiled
+extension is present, `import generators` picks it up automatically.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from string import Formatter
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from main import GenerateRequest
+
+# (ordinal, ISO string) for the current day, so the effective-date fallback only
+# formats a date once per day. Concurrent refreshes write identical values.
+_today_cache: Tuple[int, str] = (0, "")
+
+
+def today_iso() -> str:
+    global _today_cache
+    today = date.today()
+    if today.toordinal() != _today_cache[0]:
+        _today_cache = (today.toordinal(), today.isoformat())
+    return _today_cache[1]
+
+
+# Every heading used by the generators, rendered once into a shared table.
+_HEADING_CACHE = {
+    text: f"\n\n{text}\n" + ("-" * len(text)) + "\n\n"
+    for text in (
+        # Privacy Policy
+        "Introduction", "Information We Collect", "How We Use Information",
+        "Cookies & Tracking", "Third‑Party Services", "Accounts",
+        "User‑Generated Content", "Children's Privacy", "Data Retention",
+        "Your Rights", "Security", "Contact Us", "Changes to this Policy",
+        "Jurisdiction",
+        # Terms of Service
+        "Agreement to Terms", "Use of the Service", "Accounts & Security",
+        "User Content", "Prohibited Activities", "Intellectual Property",
+        "Fees & Payments", "Disclaimers", "Limitation of Liability",
+        "Indemnification", "Governing Law; Disputes", "Termination",
+        "Changes to Terms", "Contact",
+    )
+}
+
+
+def _format_heading(text: str) -> str:
+    return _HEADING_CACHE.get(text) or f"\n\n{text}\n" + ("-" * len(text)) + "\n\n"
+
+
+# Both documents are rendered from templates assembled once at import time, so
+# headings and boilerplate are not rebuilt per request. Optional sections are
+# spliced in through `{...}_section` slots that are empty when disabled.
+# The constant text below must not contain literal braces.
+#
+# Templates are pre-split into literal chunks and slot names, so rendering is a
+# single join over leaf strings instead of str.format re-parsing ~2 KB of
+# template text on every call.
+
+_CompiledTemplate = Tuple[Tuple[str, ...], Tuple[str, ...]]
+
+
+def _compile_template(template: str) -> _CompiledTemplate:
+    literals: List[str] = []
+    fields: List[str] = []
+    for literal, field, _spec, _conv in Formatter().parse(template):
+        literals.append(literal)
+        if field is not None:
+            fields.append(field)
+    if len(literals) == len(fields):
+        literals.append("")
+    return tuple(literals), tuple(fields)
+
+
+def _render(template: _CompiledTemplate, values: Dict[str, str]) -> str:
+    literals, fields = template
+    parts = [""] * (2 * len(fields) + 1)
+    parts[0::2] = literals
+    parts[1::2] = [values[name] for name in fields]
+    return "".join(parts)
+
+
+_PRIVACY_TEMPLATE = _compile_template("\n\n".join([
+    "Privacy Policy for {bn}\nEffective date: {eff}",
+    _format_heading("Introduction") + "{intro}",
+    _format_heading("Information We Collect") + "{collect_line}",
+    _format_heading("How We Use Information") +
+    "We use information to provide and improve the Service, communicate with you, personalize content, ensure security, and comply with legal obligations.",
+    _format_heading("Cookies & Tracking") + "{cookie_line} {analytics_line}",
+    _format_heading("Third‑Party Services") + "{third_party_line}{accounts_section}{user_content_section}",
+    _format_heading("Children's Privacy") + "{children_line}",
+    _format_heading("Data Retention") +
+    "We retain information for as long as necessary to provide the Service, comply with obligations, resolve disputes, and enforce agreements.",
+    _format_heading("Your Rights") +
+    "Depending on your location ({juris}), you may have rights to access, correct, delete, or restrict processing of your personal information, and to object or withdraw consent.",
+    _format_heading("Security") +
+    "We implement reasonable technical and organizational measures to protect information. No method of transmission or storage is completely secure.",
+    _format_heading("Contact Us") + "Email: {email}{address_line}",
+    _format_heading("Changes to this Policy") +
+    "We may update this Privacy Policy from time to time. We will revise the effective date above and post the updated version on this page.",
+    _format_heading("Jurisdiction") + "This Policy is governed by the laws of {juris} unless otherwise required by applicable law.",
+]))
+
+_TERMS_TEMPLATE = _compile_template("\n\n".join([
+    "Terms of Service for {bn}\nEffective date: {eff}",
+    _format_heading("Agreement to Terms") +
+    "By accessing or using {url}, you agree to be bound by these Terms. If you do not agree, do not use the Service.",
+    _format_heading("Use of the Service") +
+    "You may use the Service only in compliance with these Terms and all applicable laws. We may suspend or terminate access for conduct that violates these Terms or harms the Service.{accounts_section}{user_content_section}",
+    _format_heading("Prohibited Activities") +
+    "You agree not to: (i) misuse or interfere with the Service; (ii) reverse engineer; (iii) upload malware; (iv) violate laws; (v) infringe intellectual property or privacy rights.",
+    _format_heading("Intellectual Property") +
+    "All rights, title, and interest in the Service (excluding user content) are owned by {bn} and its licensors.",
+    _format_heading("Fees & Payments") +
+    "If the Service includes paid features, you agree to pay applicable fees and taxes. Payments are non‑refundable except as required by law or our stated policy.",
+    _format_heading("Disclaimers") +
+    "THE SERVICE IS PROVIDED \"AS IS\" WITHOUT WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED. WE DISCLAIM ALL WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND NON‑INFRINGEMENT.",
+    _format_heading("Limitation of Liability") +
+    "TO THE MAXIMUM EXTENT PERMITTED BY LAW, WE WILL NOT BE LIABLE FOR INDIRECT, INCIDENTAL, SPECIAL, CONSEQUENTIAL, OR PUNITIVE DAMAGES, OR ANY LOSS OF PROFITS OR DATA.",
+    _format_heading("Indemnification") +
+    "You agree to defend, indemnify, and hold harmless us and our affiliates from claims arising out of your use of the Service or your violation of these Terms.",
+    _format_heading("Governing Law; Disputes") +
+    "These Terms are governed by the laws of {juris}, without regard to conflict of law principles. Venue and jurisdiction will lie in the courts located in {juris}, unless otherwise required by law.",
+    _format_heading("Termination") +
+    "We may suspend or terminate your access at any time for any reason. Upon termination, provisions that by their nature should survive will survive.",
+    _format_heading("Changes to Terms") +
+    "We may update these Terms from time to time. By continuing to use the Service after changes take effect, you agree to the revised Terms.",
+    _format_heading("Contact") +
+    "For questions about these Terms, please contact us at the email listed in the Privacy Policy.",
+]))
+
+# Boolean-dependent fragments, stored as (when False, when True) and indexed by
+# the request flag directly.
+
+_PRIVACY_COLLECT_LINE = (
+    "We do not intentionally collect personal information. Limited technical data may be processed to operate the Service.",
+    "We may collect information you provide directly (such as name, email address, billing details) and information collected automatically (such as IP address, device info, pages viewed).",
+)
+
+_PRIVACY_COOKIE_LINE = (
+    "We do not use cookies for tracking beyond what is strictly necessary to operate the Service.",
+    "We use cookies and similar technologies to remember preferences and to understand how the Service is used.",
+)
+
+_PRIVACY_ANALYTICS_LINE = (
+    "We do not use third‑party analytics tools for tracking.",
+    "We use analytics to understand usage and improve the Service.",
+)
+
+_PRIVACY_THIRD_PARTY_LINE = (
+    "We do not share personal information with third parties except as required by law or to protect our rights.",
+    "We may share information with service providers that help us operate the Service (e.g., hosting, payments, analytics). These providers may process data on our behalf and are bound by contractual obligations.",
+)
+
+_PRIVACY_ACCOUNTS_SECTION = (
+    "",
+    "\n\n" + _format_heading("Accounts") +
+    "If you create an account, you are responsible for maintaining the confidentiality of your credentials and for any activity under your account.",
+)
+
+_PRIVACY_USER_CONTENT_SECTION = (
+    "",
+    "\n\n" + _format_heading("User‑Generated Content") +
+    "Content you submit may be publicly visible depending on your settings. Do not share personal information you prefer to keep private.",
+)
+
+_TERMS_ACCOUNTS_SECTION = (
+    "",
+    "\n\n" + _format_heading("Accounts & Security") +
+    "You must provide accurate information and keep your account secure. You are responsible for activities under your account.",
+)
+
+_TERMS_USER_CONTENT_SECTION = (
+    "",
+    "\n\n" + _format_heading("User Content") +
+    "You retain ownership of content you submit. By submitting content, you grant us a non‑exclusive, worldwide, royalty‑free license to use, reproduce, and display it to operate the Service. You represent that your content does not infringe others' rights.",
+)
+
+
+@dataclass(slots=True, frozen=True)
+class _Context:
+    """Request-derived values shared by both documents"""
+    bn: str
+    url: Optional[str]
+    email: str
+    juris: str
+    eff: str
+    addr: Optional[str]
+
+
+def _build_ctx(req: "GenerateRequest") -> _Context:
+    return _Context(
+        bn=req.business_name,
+        url=req.website_url,
+        email=req.contact_email or "support@example.com",
+        juris=req.jurisdiction or "your jurisdiction",
+        eff=req.effective_date.isoformat() if req.effective_date else today_iso(),
+        addr=req.company_address,
+    )
+
+
+def _render_privacy(req: "GenerateRequest", ctx: _Context) -> str:
+    url = ctx.url or "your website/app"
+
+    if req.age_restriction:
+        children_line = f"The Service is intended for users {req.age_restriction}. We do not knowingly collect personal information from children in violation of applicable laws."
+    else:
+        children_line = "The Service is not directed to children under the age required by applicable law. We do not knowingly collect personal information from children."
+
+    return _render(_PRIVACY_TEMPLATE, {
+        "bn": ctx.bn,
+        "eff": ctx.eff,
+        "juris": ctx.juris,
+        "email": ctx.email,
+        "intro": req.description or f"This Privacy Policy explains how {ctx.bn} collects, uses, and shares information when you use {url} (the \"Service\").",
+        "collect_line": _PRIVACY_COLLECT_LINE[req.collects_personal_data],
+        "cookie_line": _PRIVACY_COOKIE_LINE[req.uses_cookies],
+        "analytics_line": _PRIVACY_ANALYTICS_LINE[req.uses_analytics],
+        "third_party_line": _PRIVACY_THIRD_PARTY_LINE[req.uses_third_party_tools],
+        "accounts_section": _PRIVACY_ACCOUNTS_SECTION[req.allows_user_accounts],
+        "user_content_section": _PRIVACY_USER_CONTENT_SECTION[req.allows_user_content],
+        "children_line": children_line,
+        "address_line": f"\nAddress: {ctx.addr}" if ctx.addr else "",
+    })
+
+
+def _render_terms(req: "GenerateRequest", ctx: _Context) -> str:
+    return _render(_TERMS_TEMPLATE, {
+        "bn": ctx.bn,
+        "url": ctx.url or "our Service",
+        "eff": ctx.eff,
+        "juris": ctx.juris,
+        "accounts_section": _TERMS_ACCOUNTS_SECTION[req.allows_user_accounts],
+        "user_content_section": _TERMS_USER_CONTENT_SECTION[req.allows_user_content],
+    })
+
+
+def generate_privacy(req: "GenerateRequest") -> str:
+    return _render_privacy(req, _build_ctx(req))
+
+
+def generate_terms(req: "GenerateRequest") -> str:
+    return _render_terms(req, _build_ctx(req))
+
+
+def generate_both(req: "GenerateRequest") -> Tuple[str, str]:
+    """Render (privacy_policy, terms_of_service), sharing the request context"""
+    ctx = _build_ctx(req)
+    return _render_privacy(req, ctx), _render_terms(req, ctx)
@@ -0,0 +1,22 @@
+"""
+Optional ahead-of-time build of the legal text generators with mypyc.
+
+    pip install mypy
+    python setup.py build_ext --inplace
+
+This produces a compiled `generators` extension next to generators.py, which
+Python imports in preference to the source file. Only the generators are
+compiled; the FastAPI layer in main.py stays interpreted. Delete the built
+extension to fall back to pure Python.
+"""
+
+from setuptools import setup
+from mypyc.build import mypycify
+
+setup(
+    name="legal-docs-generators",
+    py_modules=[],
+    # Type errors in the uncompiled modules generators.py imports for typing
+    # must not block the build.
+    ext_modules=mypycify(["--follow-imports=silent", "generators.py"]),
+)